@@ -0,0 +1,62 @@
+"""
+Compare report serialization cost and payload size across response modes.
+
+    python -m benchmarks.bench_responses [iterations]
+"""
+import sys, json, time
+from src.report import DISCLAIMER
+from src.responses import shape_report, dumps, compress, orjson, brotli
+
+def sample_report(n_lines: int = 12) -> dict:
+    return {
+        "overall_score": 72.5,
+        "tier": "Possible fit",
+        "gated_by_must_haves": False,
+        "missing_must_haves": [],
+        "components": {
+            "skills_coverage": 28.4, "responsibilities_similarity": 17.9,
+            "seniority_alignment": 10.0, "domain_fit": 5.0, "education": 5.0,
+            "location": 2.5, "outcomes_alignment": 4.0
+        },
+        "matched_lines": [{
+            "jd_line": f"Own the roadmap for ML-powered product area {i} with measurable outcomes",
+            "cv_supporting_line": f"Led roadmap for recommender system {i}, increasing conversion by 12%",
+            "similarity": 0.812
+        } for i in range(n_lines)],
+        "improvements": ["Address: Partner with data science on experimentation with a recent, outcome-focused example."],
+        "disclaimer": DISCLAIMER,
+        "plan_version": "0f20f2b10ed9",
+        "modes": {"parsing": "ai-powered", "embeddings": "ai-powered"},
+        "timings_sec": {"parse_jd": 2.341, "parse_cv": 3.127, "skills_score": 0.023,
+                        "responsibility_match": 0.156, "rest": 0.089, "total": 5.736}
+    }
+
+def _time(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1e6
+
+def main(n: int = 20000):
+    report = sample_report()
+    # plain json.dumps; FastAPI's default path adds jsonable_encoder on top
+    baseline = lambda: json.dumps(report).encode("utf-8")
+    cases = [
+        ("stdlib json, full", baseline),
+        ("fast, full", lambda: dumps(report)),
+        ("fast, compact", lambda: dumps(shape_report(report, compact=True))),
+        ("fast, scores only", lambda: dumps(shape_report(report, ["overall_score", "tier", "components"]))),
+    ]
+    print(f"encoder: {'orjson' if orjson else 'stdlib json'}, iterations: {n}")
+    print(f"{'mode':<22}{'us/op':>8}{'bytes':>8}")
+    for name, fn in cases:
+        print(f"{name:<22}{_time(fn, n):>8.1f}{len(fn()):>8}")
+
+    body = baseline()
+    print(f"\ncompression of full body ({len(body)} bytes):")
+    for enc in ["gzip"] + (["br"] if brotli else []):
+        out = compress(body, enc)
+        print(f"{enc:<22}{_time(lambda: compress(body, enc), max(1, n // 20)):>8.1f}{len(out):>8}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -2,21 +2,32 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 
+from fastapi.concurrency import run_in_threadpool
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
 import os
 import time
 from .engine import analyze_texts
+from .registry import get_plan, plan_status
+from .responses import report_response, parse_fields
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load config and prompts before the first request arrives"""
+    get_plan()
+    yield
 
 # Initialize FastAPI app
 app = FastAPI(
     title="JobMatch Checker", 
     version="1.0.0",
-    description="AI-powered job matching with explainable results"
+    description="AI-powered job matching with explainable results",
+    lifespan=lifespan
 )
 
 # CORS
@@ -59,21 +70,47 @@ async def home(request: Request):
     """Serve the main web interface"""
     return templates.TemplateResponse("index.html", {"request": request})
 
+def _fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Validate ?fields= up front so a typo never pays for an analysis"""
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _respond(result: Dict[str, Any], request: Request, fields: Optional[List[str]], compact: bool) -> Response:
+    """Serialize a report with field selection, compact mode and compression"""
+    return report_response(
+        result,
+        accept_encoding=request.headers.get("accept-encoding", ""),
+        fields=fields,
+        compact=compact
+    )
+
 @app.post("/analyze")
-def analyze(req: AnalyzeRequest) -> Dict[str, Any]:
+def analyze(
+    req: AnalyzeRequest,
+    request: Request,
+    fields: Optional[str] = None,
+    compact: bool = False
+) -> Response:
     """Analyze job description and CV text"""
+    selected = _fields(fields)
     try:
         result = analyze_texts(req.jd_text, req.cv_text)
-        return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+    return _respond(result, request, selected, compact)
 
 @app.post("/analyze-file")
 async def analyze_file(
+    request: Request,
     jd_text: str,
-    cv_file: UploadFile = File(...)
-) -> Dict[str, Any]:
+    cv_file: UploadFile = File(...),
+    fields: Optional[str] = None,
+    compact: bool = False
+) -> Response:
     """Analyze job description with uploaded CV file"""
+    selected = _fields(fields)
     try:
         # Read file content
         if cv_file.content_type not in ["text/plain", "application/pdf"]:
@@ -95,11 +132,13 @@ async def analyze_file(
                 detail="PDF parsing not implemented yet. Please use text files or paste content directly."
             )
         
-        result = analyze_texts(jd_text, cv_text)
-        return result
+        # keep blocking LLM calls and compression off the event loop,
+        # matching the sync /analyze handler
+        result = await run_in_threadpool(analyze_texts, jd_text, cv_text)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"File analysis failed: {str(e)}")
+    return await run_in_threadpool(_respond, result, request, selected, compact)
 
 @app.get("/health")
 def health():
@@ -116,6 +155,7 @@ def get_config():
     return {
         "openai_configured": bool(os.getenv("OPENAI_API_KEY")),
         "version": "1.0.0",
+        "plan": plan_status(),
         "features": {
             "web_interface": True,
             "file_upload": True,
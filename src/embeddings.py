@@ -1,7 +1,12 @@
-import os, time, numpy as np
-from openai import OpenAI, RateLimitError, APIConnectionError, APIStatusError
+import os, time
+from typing import TYPE_CHECKING
+
+# numpy and openai are imported on first use to keep cold start fast
+if TYPE_CHECKING:
+    import numpy as np
 
 def _retry(fn, tries=3, base=0.5, factor=2.0):
+    from openai import RateLimitError, APIConnectionError, APIStatusError
     for i in range(tries):
         try:
             return fn()
@@ -10,8 +15,9 @@ def _retry(fn, tries=3, base=0.5, factor=2.0):
                 raise
             time.sleep(base * (factor ** i))
 
-def _fallback_vec(text: str) -> np.ndarray:
+def _fallback_vec(text: str) -> "np.ndarray":
     """Generate deterministic fallback vector"""
+    import numpy as np
     h = abs(hash(text)) % (10**6)
     rng = np.random.default_rng(h)
     return rng.standard_normal(1536)
@@ -25,6 +31,8 @@ def embed_func(text: str):
     if not api_key:
         return _fallback_vec(text), "fallback"
 
+    import numpy as np
+    from openai import OpenAI
     client = OpenAI(api_key=api_key)
     try:
         resp = _retry(lambda: client.embeddings.create(
@@ -49,6 +57,8 @@ def embed_many(texts: list[str]):
     if not api_key:
         return [_fallback_vec(t) for t in texts], "fallback"
     
+    import numpy as np
+    from openai import OpenAI
     client = OpenAI(api_key=api_key)
     try:
         resp = _retry(lambda: client.embeddings.create(
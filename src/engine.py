@@ -1,4 +1,4 @@
-import os, json, time
+import time
 from typing import Dict, Any
 from .parsers import parse_jd_text, parse_cv_text
 from .scoring import (
@@ -9,35 +9,33 @@ from .scoring import (
 from .extractor import check_must_haves, build_improvements
 from .report import make_report_json
 from .embeddings import embed_func
-
-BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-
-with open(os.path.join(BASE_DIR, "config", "weights.json"), "r") as f:
-    WEIGHTS = json.load(f)
-with open(os.path.join(BASE_DIR, "config", "thresholds.json"), "r") as f:
-    THR = json.load(f)
+from .registry import get_plan
 
 def _cap_list(xs, n): 
     return xs[:n] if xs else []
 
 def analyze_texts(jd_text: str, cv_text: str) -> Dict[str, Any]:
+    # take one plan for the whole request so a hot reload can't mix versions
+    plan = get_plan()
+    weights, thr = plan.weights, plan.thresholds
+
     t0 = time.time()
-    jd = parse_jd_text(jd_text); t_jd = time.time()
-    cv = parse_cv_text(cv_text); t_cv = time.time()
+    jd = parse_jd_text(jd_text, plan); t_jd = time.time()
+    cv = parse_cv_text(cv_text, plan); t_cv = time.time()
 
     # Cap bullets to reduce tokens and improve performance
     jd["responsibilities"] = _cap_list(jd.get("responsibilities"), 12)
     cv["experience_bullets"] = _cap_list(cv.get("experience_bullets"), 25)
 
-    skills = score_skills(jd, cv, WEIGHTS, THR); t_skills = time.time()
+    skills = score_skills(jd, cv, weights, thr); t_skills = time.time()
     resp, src_map, resp_mode = score_responsibilities_semantic(
         jd.get("responsibilities", []),
         cv.get("experience_bullets", []),
-        THR,
+        thr,
         embed_func
     ); t_resp = time.time()
 
-    seniority = score_seniority(jd.get("seniority"), cv.get("titles", []), THR)
+    seniority = score_seniority(jd.get("seniority"), cv.get("titles", []), thr)
     domain = score_domain(jd.get("domain", []), cv.get("domains", []))
     edu = score_education(jd.get("education_required", ""), cv.get("education", ""), cv.get("certifications", []))
     loc = score_location(jd.get("visa_or_timezone", ""), cv)
@@ -56,17 +54,18 @@ def analyze_texts(jd_text: str, cv_text: str) -> Dict[str, Any]:
       "outcomes_alignment": round(outcomes, 1)
     }
 
-    overall = weighted_sum(components, WEIGHTS)
+    overall = weighted_sum(components, weights, plan.norm)
 
     missing = check_must_haves(jd.get("must_have_experience", []), cv)
     gated = len(missing) > 0
     if gated:
-        overall = min(overall, THR["must_have_cap"])
+        overall = min(overall, thr["must_have_cap"])
 
-    tier = bucket(overall, THR)
-    improv = build_improvements(jd, cv, src_map, THR)
+    tier = bucket(overall, thr)
+    improv = build_improvements(jd, cv, src_map, thr)
 
     report = make_report_json(overall, tier, gated, missing, components, src_map, improv)
+    report["plan_version"] = plan.version
     # add modes to help you debug
     report["modes"] = {
         "parsing": parse_mode,
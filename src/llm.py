@@ -1,6 +1,5 @@
 import os, json, time
 from typing import Dict, Any
-from openai import OpenAI, APIConnectionError, RateLimitError, APIStatusError
 
 FALLBACK_JD = {
   "title":"Unknown","seniority":"Senior","location_policy":"",
@@ -16,6 +15,7 @@ FALLBACK_CV = {
 }
 
 def _retry(fn, tries=3, base=0.6, factor=2.0):
+    from openai import APIConnectionError, RateLimitError, APIStatusError
     for i in range(tries):
         try:
             return fn()
@@ -32,6 +32,7 @@ def llm_json_parse(prompt: str) -> Dict[str, Any]:
         out["_mode"] = "fallback"
         return out
 
+    from openai import OpenAI  # imported lazily; fallback mode never needs it
     client = OpenAI(api_key=api_key)
 
     def _call():
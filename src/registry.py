@@ -0,0 +1,212 @@
+import os, json, time, hashlib, threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+from .scoring import COMPONENT_MAX, normalization_factors
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# files the plan is compiled from, keyed by what they feed
+CONFIG_FILES = {
+    "weights": os.path.join("config", "weights.json"),
+    "thresholds": os.path.join("config", "thresholds.json"),
+    "synonyms": os.path.join("config", "synonyms.json"),
+}
+PROMPT_FILES = {
+    "parse_jd.md": "{{JD_TEXT}}",
+    "parse_cv.md": "{{CV_TEXT}}",
+}
+REQUIRED_THRESHOLDS = [
+    "semantic_match_min", "tier_strong", "tier_good", "tier_possible",
+    "tier_needs", "recency_weights", "must_have_cap", "title_levels"
+]
+
+# how often (seconds) get_plan() may stat the files for changes
+RELOAD_CHECK_SEC = float(os.getenv("CONFIG_RELOAD_SEC", "2"))
+
+@dataclass(frozen=True)
+class ScoringPlan:
+    version: str
+    weights: Mapping[str, float]
+    thresholds: Mapping[str, Any]
+    synonyms: Mapping[str, tuple]
+    prompts: Mapping[str, str]
+    norm: Mapping[str, float]
+    loaded_at: float
+    synonyms_error: Optional[str] = None
+
+def _freeze(obj):
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+def _is_number(x) -> bool:
+    # bool is an int subclass but never a meaningful weight or threshold
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+def _check_numbers(name: str, mapping: Dict, keys) -> None:
+    for k in keys:
+        if not _is_number(mapping[k]):
+            raise ValueError(f"{name}: '{k}' must be a number")
+
+def _validate(weights: Dict, thr: Dict, prompts: Dict[str, str]) -> None:
+    for name, obj in [("weights", weights), ("thresholds", thr)]:
+        if not isinstance(obj, dict):
+            raise ValueError(f"{name}.json must contain a JSON object")
+
+    missing = [k for k in COMPONENT_MAX if k not in weights]
+    if missing:
+        raise ValueError(f"weights.json missing components: {missing}")
+    _check_numbers("weights.json", weights, weights)
+    if any(w < 0 for w in weights.values()):
+        raise ValueError("weights.json: weights must be non-negative")
+    if sum(weights[k] for k in COMPONENT_MAX) <= 0:
+        raise ValueError("weights.json: component weights must not all be zero")
+
+    missing = [k for k in REQUIRED_THRESHOLDS if k not in thr]
+    if missing:
+        raise ValueError(f"thresholds.json missing keys: {missing}")
+    _check_numbers("thresholds.json", thr, [
+        "semantic_match_min", "tier_strong", "tier_good", "tier_possible",
+        "tier_needs", "must_have_cap"
+    ])
+    if not (thr["tier_strong"] >= thr["tier_good"] >= thr["tier_possible"] >= thr["tier_needs"]):
+        raise ValueError("thresholds.json: tier thresholds must be descending")
+    for k in ["recency_weights", "title_levels"]:
+        if not isinstance(thr[k], dict):
+            raise ValueError(f"thresholds.json: '{k}' must be an object")
+    missing = [k for k in ["0_3", "3_7", "7_inf"] if k not in thr["recency_weights"]]
+    if missing:
+        raise ValueError(f"thresholds.json: recency_weights missing {missing}")
+    _check_numbers("thresholds.json recency_weights", thr["recency_weights"], thr["recency_weights"])
+    _check_numbers("thresholds.json title_levels", thr["title_levels"], thr["title_levels"])
+
+    for name, placeholder in PROMPT_FILES.items():
+        if placeholder not in prompts[name]:
+            raise ValueError(f"prompts/{name} is missing the {placeholder} placeholder")
+
+def _source_paths(base_dir: str) -> Dict[str, str]:
+    paths = {k: os.path.join(base_dir, p) for k, p in CONFIG_FILES.items()}
+    paths.update({n: os.path.join(base_dir, "prompts", n) for n in PROMPT_FILES})
+    return paths
+
+def _load_synonyms(raw: bytes) -> Tuple[Dict[str, list], Optional[str]]:
+    """
+    Synonyms are not used by scoring yet, so a bad file must not block the
+    rest of the plan: it loads as empty and the problem is reported instead.
+    """
+    try:
+        synonyms = json.loads(raw)
+        if not isinstance(synonyms, dict):
+            raise ValueError("synonyms.json must contain a JSON object")
+        for k, v in synonyms.items():
+            if not isinstance(v, list) or not all(isinstance(s, str) for s in v):
+                raise ValueError(f"synonyms.json: '{k}' must map to a list of strings")
+    except ValueError as e:
+        return {}, str(e)
+    return {k.lower(): [s.lower() for s in v] for k, v in synonyms.items()}, None
+
+def _signatures(paths: Dict[str, str]) -> Dict[str, Tuple[int, int]]:
+    # size catches rewrites that land in the same (coarse) mtime tick
+    sigs = {}
+    for k, p in paths.items():
+        st = os.stat(p)
+        sigs[k] = (st.st_mtime_ns, st.st_size)
+    return sigs
+
+def compile_plan(base_dir: str = BASE_DIR) -> ScoringPlan:
+    """Read, validate and compile all config + prompt files into a ScoringPlan."""
+    raw = {}
+    for k, p in _source_paths(base_dir).items():
+        with open(p, "rb") as f:
+            raw[k] = f.read()
+
+    weights = json.loads(raw["weights"])
+    thr = json.loads(raw["thresholds"])
+    prompts = {n: raw[n].decode("utf-8") for n in PROMPT_FILES}
+    _validate(weights, thr, prompts)
+    synonyms, synonyms_error = _load_synonyms(raw["synonyms"])
+
+    # version is content-addressed, so identical files give identical versions
+    h = hashlib.sha1()
+    for k in sorted(raw):
+        h.update(k.encode()); h.update(b"\0"); h.update(raw[k])
+
+    return ScoringPlan(
+        version=h.hexdigest()[:12],
+        weights=_freeze(weights),
+        thresholds=_freeze(thr),
+        synonyms=_freeze(synonyms),
+        prompts=_freeze(prompts),
+        norm=_freeze(normalization_factors(weights)),
+        loaded_at=time.time(),
+        synonyms_error=synonyms_error
+    )
+
+class PlanRegistry:
+    """
+    Holds the current ScoringPlan and swaps it when the source files change.
+    Readers always get a complete plan; a broken edit keeps the previous one.
+    """
+    def __init__(self, base_dir: str = BASE_DIR, check_every: float = RELOAD_CHECK_SEC):
+        self.base_dir = base_dir
+        self.check_every = check_every
+        self._paths = _source_paths(base_dir)
+        self._lock = threading.Lock()
+        self._plan: Optional[ScoringPlan] = None
+        self._sigs: Optional[Dict[str, Tuple[int, int]]] = None
+        self._next_check = 0.0
+        self.last_error: Optional[str] = None
+
+    def get(self) -> ScoringPlan:
+        plan = self._plan
+        if plan is not None and time.monotonic() < self._next_check:
+            return plan
+        return self._refresh()
+
+    def _refresh(self) -> ScoringPlan:
+        with self._lock:
+            now = time.monotonic()
+            if self._plan is not None and now < self._next_check:
+                return self._plan
+            self._next_check = now + self.check_every
+            try:
+                before = _signatures(self._paths)
+                if self._plan is not None and before == self._sigs:
+                    # files are back to what the current plan was built from
+                    self.last_error = None
+                    return self._plan
+                plan = compile_plan(self.base_dir)
+                after = _signatures(self._paths)
+            except Exception as e:
+                # first load must succeed; later failures keep serving the old
+                # plan and are retried on the next check, since the file may
+                # simply have been caught mid-write
+                if self._plan is None:
+                    raise
+                self.last_error = str(e)
+                return self._plan
+            # if a file changed while we were reading, forget the signatures
+            # so the next check compiles again
+            self._sigs = before if after == before else None
+            self._plan, self.last_error = plan, None
+            return plan
+
+    def status(self) -> Dict[str, Any]:
+        plan = self.get()
+        return {
+            "version": plan.version,
+            "loaded_at": plan.loaded_at,
+            "last_error": self.last_error,
+            "synonyms_error": plan.synonyms_error
+        }
+
+_REGISTRY = PlanRegistry()
+
+def get_plan() -> ScoringPlan:
+    return _REGISTRY.get()
+
+def plan_status() -> Dict[str, Any]:
+    return _REGISTRY.status()
@@ -6,6 +6,14 @@ DISCLAIMER = (
   "We use keyword normalization and semantic similarity to approximate relevance. Human review is essential."
 )
 
+# every top-level key of a report: make_report_json builds the first eight,
+# engine.analyze_texts adds the rest
+REPORT_FIELDS = (
+    "overall_score", "tier", "gated_by_must_haves", "missing_must_haves",
+    "components", "matched_lines", "improvements", "disclaimer",
+    "plan_version", "modes", "timings_sec"
+)
+
 def make_report_json(overall, tier, gated, missing, components, source_lines, improvement_list) -> Dict[str, Any]:
     return {
         "overall_score": round(overall, 1),
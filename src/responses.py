@@ -0,0 +1,94 @@
+import os, json, gzip
+from typing import Dict, Any, Iterable, List, Optional
+from fastapi.responses import Response
+from .report import REPORT_FIELDS
+
+# orjson and brotli are optional; fall back to stdlib json / gzip-only
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# bodies smaller than this are sent uncompressed; the overhead isn't worth it
+MIN_COMPRESS_BYTES = int(os.getenv("MIN_COMPRESS_BYTES", "1024"))
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+# bulky, human-oriented fields dropped in compact mode
+COMPACT_DROP = ("matched_lines", "disclaimer")
+
+def parse_fields(raw: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated ?fields= value into report keys.
+    Returns None for an empty selection; raises ValueError on unknown names.
+    """
+    fields = [f.strip() for f in (raw or "").split(",") if f.strip()]
+    unknown = [f for f in fields if f not in REPORT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown report fields: {unknown}")
+    return fields or None
+
+def shape_report(report: Dict[str, Any], fields: Optional[Iterable[str]] = None, compact: bool = False) -> Dict[str, Any]:
+    """
+    Project a report onto already-validated fields (see parse_fields).
+    Explicitly selected fields are kept even in compact mode.
+    """
+    if fields:
+        return {f: report[f] for f in fields if f in report}
+    out = dict(report)
+    if compact:
+        for k in COMPACT_DROP:
+            out.pop(k, None)
+    return out
+
+def dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick 'br' or 'gzip' from an Accept-Encoding header: the one with the
+    highest q wins, br breaks ties, and q=0 means not acceptable.
+    """
+    accepted = {}
+    for part in (accept_encoding or "").lower().split(","):
+        name, *params = [p.strip() for p in part.split(";")]
+        q = 1.0
+        for p in params:
+            if p.startswith("q="):
+                try:
+                    q = float(p[2:])
+                except ValueError:
+                    q = 0.0
+        if name:
+            accepted[name] = q
+    wildcard = accepted.get("*", 0.0)
+    candidates = (["br"] if brotli is not None else []) + ["gzip"]
+    best, best_q = None, 0.0
+    for enc in candidates:
+        q = accepted.get(enc, wildcard)
+        if q > best_q:
+            best, best_q = enc, q
+    return best
+
+def compress(body: bytes, encoding: Optional[str]) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    return body
+
+def report_response(report: Dict[str, Any], accept_encoding: str = "", fields: Optional[Iterable[str]] = None, compact: bool = False) -> Response:
+    body = dumps(shape_report(report, fields, compact))
+    headers = {"Vary": "Accept-Encoding"}
+    if len(body) >= MIN_COMPRESS_BYTES:
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding:
+            body = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
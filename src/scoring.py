@@ -1,7 +1,22 @@
-from typing import List, Dict, Any, Tuple
-import numpy as np
-
-def cosine(a: np.ndarray, b: np.ndarray) -> float:
+from typing import List, Dict, Any, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# best raw score each component can reach; skills_coverage is already
+# scaled by its own weight inside score_skills, so its max is that weight
+COMPONENT_MAX = {
+    "skills_coverage": None,
+    "responsibilities_similarity": 25.0,
+    "seniority_alignment": 10.0,
+    "domain_fit": 10.0,
+    "education": 5.0,
+    "location": 5.0,
+    "outcomes_alignment": 10.0
+}
+
+def cosine(a: "np.ndarray", b: "np.ndarray") -> float:
+    import numpy as np
     na, nb = np.linalg.norm(a), np.linalg.norm(b)
     if na == 0 or nb == 0:
         return 0.0
@@ -115,8 +130,24 @@ def score_outcomes(bullets: List[Dict[str,Any]], jd: Dict) -> float:
             score += 2.0
     return min(10.0, score)
 
-def weighted_sum(parts: Dict[str,float], weights: Dict[str,int]) -> float:
-    return sum(parts.values())
+def normalization_factors(weights: Dict[str,float]) -> Dict[str,float]:
+    """
+    Per-component multipliers mapping raw scores onto a 0-100 overall where
+    each component contributes at most its share of the total weight.
+    With the shipped weights.json every factor is 1.0.
+    """
+    total = sum(weights.get(k, 0) for k in COMPONENT_MAX)
+    norm = {}
+    for k, cap in COMPONENT_MAX.items():
+        w = weights.get(k, 0)
+        cap = w if cap is None else cap
+        norm[k] = (100.0 * w / total) / cap if total and cap else 0.0
+    return norm
+
+def weighted_sum(parts: Dict[str,float], weights: Dict[str,int], norm: Dict[str,float] = None) -> float:
+    if norm is None:
+        norm = normalization_factors(weights)
+    return sum(v * norm.get(k, 1.0) for k, v in parts.items())
 
 def bucket(overall: float, thr: Dict[str,Any]) -> str:
     if overall >= thr["tier_strong"]: return "Strong fit"
@@ -0,0 +1,121 @@
+import os, json, shutil
+import pytest
+from src.registry import PlanRegistry, compile_plan, BASE_DIR
+from src.scoring import COMPONENT_MAX, normalization_factors, weighted_sum
+
+@pytest.fixture
+def config_dir(tmp_path):
+    for d in ["config", "prompts"]:
+        shutil.copytree(os.path.join(BASE_DIR, d), tmp_path / d)
+    return tmp_path
+
+def _edit(base, name, same_tick=False, **changes):
+    path = base / "config" / name
+    before = os.stat(path)
+    data = json.loads(path.read_text())
+    data.update(changes)
+    path.write_text(json.dumps(data))
+    st = os.stat(path)
+    if same_tick:
+        # simulate a rewrite landing in the same coarse mtime tick
+        os.utime(path, ns=(st.st_atime_ns, before.st_mtime_ns))
+    else:
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+def test_shipped_weights_leave_scores_unchanged():
+    plan = compile_plan()
+    assert all(f == pytest.approx(1.0) for f in plan.norm.values())
+    parts = {"skills_coverage": 20.0, "responsibilities_similarity": 12.5, "seniority_alignment": 5.0,
+             "domain_fit": 10.0, "education": 2.5, "location": 5.0, "outcomes_alignment": 4.0}
+    assert weighted_sum(parts, plan.weights, plan.norm) == pytest.approx(sum(parts.values()))
+
+def test_normalization_keeps_0_100_scale_for_any_weight_total():
+    weights = {k: 1 for k in COMPONENT_MAX}
+    norm = normalization_factors(weights)
+    # perfect scores: skills is scaled by its own weight inside score_skills
+    best = {k: (weights[k] if cap is None else cap) for k, cap in COMPONENT_MAX.items()}
+    assert weighted_sum(best, weights, norm) == pytest.approx(100.0)
+    assert norm["education"] == pytest.approx((100 / 7) / 5.0)
+
+def test_zero_weight_component_contributes_nothing():
+    weights = {k: 10 for k in COMPONENT_MAX}
+    weights["location"] = 0
+    norm = normalization_factors(weights)
+    assert norm["location"] == 0.0
+    assert weighted_sum({"location": 5.0}, weights, norm) == 0.0
+
+def test_reload_swaps_plan_on_change(config_dir):
+    reg = PlanRegistry(str(config_dir), check_every=0)
+    first = reg.get()
+    assert reg.get() is first
+    _edit(config_dir, "weights.json", education=10)
+    second = reg.get()
+    assert second.version != first.version
+    assert second.weights["education"] == 10
+    assert reg.last_error is None
+
+@pytest.mark.parametrize("name,changes", [
+    ("thresholds.json", {"tier_good": "80"}),
+    ("thresholds.json", {"recency_weights": 5}),
+    ("thresholds.json", {"recency_weights": {"0_3": "x", "3_7": 0.6, "7_inf": 0.3}}),
+    ("thresholds.json", {"semantic_match_min": None}),
+    ("thresholds.json", {"must_have_cap": "69"}),
+    ("thresholds.json", {"title_levels": ["IC"]}),
+    ("thresholds.json", {"tier_strong": 10}),
+    ("weights.json", {"education": True}),
+    ("weights.json", {"education": -1}),
+    ("weights.json", dict({k: 0 for k in COMPONENT_MAX}, extra=100)),
+])
+def test_invalid_edit_keeps_previous_plan(config_dir, name, changes):
+    reg = PlanRegistry(str(config_dir), check_every=0)
+    good = reg.get()
+    _edit(config_dir, name, **changes)
+    assert reg.get() is good
+    assert reg.last_error
+    # still rejected on the next check, without raising
+    assert reg.get() is good
+
+def test_same_tick_rewrite_is_picked_up(config_dir):
+    reg = PlanRegistry(str(config_dir), check_every=0)
+    reg.get()
+    _edit(config_dir, "weights.json", same_tick=True, education=10)
+    assert reg.get().weights["education"] == 10
+
+def test_fixed_file_loads_after_failed_edit_in_same_tick(config_dir):
+    reg = PlanRegistry(str(config_dir), check_every=0)
+    good = reg.get()
+    path = config_dir / "config" / "thresholds.json"
+    original = path.read_text()
+    mtime = os.stat(path).st_mtime_ns
+    # an editor truncates then writes; the check lands in between
+    path.write_text("")
+    os.utime(path, ns=(mtime, mtime))
+    assert reg.get() is good and reg.last_error
+    path.write_text(original.replace("0.65", "0.7"))
+    os.utime(path, ns=(mtime, mtime))
+    fixed = reg.get()
+    assert fixed.thresholds["semantic_match_min"] == 0.7
+    assert reg.last_error is None
+
+def test_bad_synonyms_do_not_block_plan(config_dir):
+    (config_dir / "config" / "synonyms.json").write_text('{"sql": "postgres"}')
+    reg = PlanRegistry(str(config_dir), check_every=0)
+    plan = reg.get()
+    assert dict(plan.synonyms) == {}
+    assert "sql" in plan.synonyms_error
+    _edit(config_dir, "weights.json", education=10)
+    assert reg.get().weights["education"] == 10
+
+def test_status_reports_rejected_edit(config_dir):
+    reg = PlanRegistry(str(config_dir), check_every=0)
+    version = reg.get().version
+    _edit(config_dir, "thresholds.json", tier_good="80")
+    status = reg.status()
+    assert status["version"] == version
+    assert "tier_good" in status["last_error"]
+    assert status["loaded_at"] > 0
+
+def test_first_load_failure_raises(config_dir):
+    (config_dir / "config" / "thresholds.json").write_text("[]")
+    with pytest.raises(ValueError):
+        PlanRegistry(str(config_dir), check_every=0).get()
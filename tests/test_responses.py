@@ -0,0 +1,126 @@
+import gzip, json, asyncio
+import pytest
+from src import responses
+from src.report import REPORT_FIELDS
+from src.responses import (
+    shape_report, parse_fields, negotiate_encoding, report_response, dumps, MIN_COMPRESS_BYTES
+)
+
+REPORT = {
+    "overall_score": 72.5,
+    "tier": "Possible fit",
+    "gated_by_must_haves": False,
+    "missing_must_haves": [],
+    "components": {"skills_coverage": 30.0, "education": 5.0},
+    "matched_lines": [
+        {"jd_line": "Own the ML roadmap", "cv_supporting_line": "Led the ML roadmap", "similarity": 0.81}
+    ] * 40,
+    "improvements": [],
+    "disclaimer": "Human review is essential.",
+    "plan_version": "abc123"
+}
+
+def test_shape_report_selects_fields_in_order():
+    out = shape_report(REPORT, ["overall_score", "tier", "components"])
+    assert list(out) == ["overall_score", "tier", "components"]
+
+def test_parse_fields():
+    assert parse_fields(" overall_score, tier ,components") == ["overall_score", "tier", "components"]
+    with pytest.raises(ValueError):
+        parse_fields("overall_score,overal_score")
+
+@pytest.mark.parametrize("raw", [None, "", ",", " , "])
+def test_empty_selection_means_full_report(raw):
+    assert parse_fields(raw) is None
+    assert shape_report(REPORT, parse_fields(raw)) == REPORT
+
+def test_report_fields_match_engine_output(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    from src.engine import analyze_texts
+    assert set(analyze_texts("jd", "cv")) == set(REPORT_FIELDS)
+
+def test_compact_drops_source_lines_and_disclaimer():
+    out = shape_report(REPORT, compact=True)
+    assert "matched_lines" not in out and "disclaimer" not in out
+    assert out["overall_score"] == REPORT["overall_score"]
+    assert "matched_lines" in REPORT  # input is not mutated
+
+def test_explicit_fields_win_over_compact():
+    out = shape_report(REPORT, ["matched_lines"], compact=True)
+    assert out == {"matched_lines": REPORT["matched_lines"]}
+
+@pytest.mark.parametrize("header,expected", [
+    ("", None),
+    ("identity", None),
+    ("gzip", "gzip"),
+    ("gzip, br", "br"),
+    ("gzip;q=1, br;q=0.1", "gzip"),
+    ("br;q=0.5, gzip;q=0.9", "gzip"),
+    ("br;q=0, gzip;q=0", None),
+    ("*", "br"),
+    ("*;q=0.5, gzip;q=0", "br"),
+])
+def test_negotiate_encoding(header, expected):
+    pytest.importorskip("brotli")
+    assert negotiate_encoding(header) == expected
+
+def test_negotiate_without_brotli(monkeypatch):
+    monkeypatch.setattr(responses, "brotli", None)
+    assert negotiate_encoding("br, gzip;q=0.5") == "gzip"
+    assert negotiate_encoding("br") is None
+
+def test_small_bodies_are_not_compressed():
+    small = shape_report(REPORT, ["overall_score", "tier"])
+    assert len(dumps(small)) < MIN_COMPRESS_BYTES
+    resp = report_response(REPORT, "gzip", fields=["overall_score", "tier"])
+    assert "content-encoding" not in resp.headers
+    assert json.loads(resp.body) == small
+
+def test_large_bodies_are_gzipped():
+    assert len(dumps(REPORT)) >= MIN_COMPRESS_BYTES
+    resp = report_response(REPORT, "gzip")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert json.loads(gzip.decompress(resp.body)) == REPORT
+
+def test_large_bodies_are_brotli_compressed():
+    brotli = pytest.importorskip("brotli")
+    resp = report_response(REPORT, "br, gzip")
+    assert resp.headers["content-encoding"] == "br"
+    assert json.loads(brotli.decompress(resp.body)) == REPORT
+
+def test_dumps_matches_stdlib_json():
+    assert json.loads(dumps(REPORT)) == REPORT
+
+def test_stdlib_fallback(monkeypatch):
+    monkeypatch.setattr(responses, "orjson", None)
+    assert json.loads(dumps(REPORT)) == REPORT
+
+def _post(path, **kwargs):
+    httpx = pytest.importorskip("httpx")
+    from src.app import app
+
+    async def go():
+        transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 12345))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+            return await c.post(path, **kwargs)
+    return asyncio.run(go())
+
+def _no_engine(*args):
+    raise AssertionError("analysis must not run for invalid fields")
+
+def test_bad_fields_never_reach_engine(monkeypatch):
+    import src.app
+    monkeypatch.setattr(src.app, "analyze_texts", _no_engine)
+    r = _post("/analyze?fields=overal_score", json={"jd_text": "jd", "cv_text": "cv"})
+    assert r.status_code == 400
+    assert "overal_score" in r.json()["detail"]
+    r = _post("/analyze-file?jd_text=jd&fields=bogus", files={"cv_file": ("cv.txt", b"cv", "text/plain")})
+    assert r.status_code == 400
+
+def test_analyze_file_selects_fields(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    r = _post("/analyze-file?jd_text=jd&fields=overall_score,tier",
+              files={"cv_file": ("cv.txt", b"cv", "text/plain")})
+    assert r.status_code == 200
+    assert list(r.json()) == ["overall_score", "tier"]